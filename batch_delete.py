@@ -7,81 +7,302 @@ License: MIT
 """
 
 import argparse
+import atexit
 import json
 import os
+import re
 import subprocess
 import sys
+import threading
 import time
-from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
+from urllib.parse import quote
 
 # Configuration
 LOG_FILE = Path.home() / ".github-batch-delete.log"
 CONFIG_FILE = Path.home() / ".github-batch-delete"
+CACHE_DIR = Path.home() / ".github-batch-delete-cache"
+CACHE_TTL = 300
+API_HOST = "api.github.com"
+GRAPHQL_BATCH_SIZE = 100
+DEFAULT_WORKERS = 8
+MAX_CONFIG_SIZE = 16 * 1024 * 1024
+# GitHub flags accounts issuing more than ~80 writes per minute or ~900 per
+# hour. The first 80 deletions run unpaced; after that the bucket refills at
+# 800/hour, so no hour exceeds 880 writes (retries count too)
+RATE_LIMIT_PER_HOUR = 800
+RATE_LIMIT_PER_SECOND = RATE_LIMIT_PER_HOUR / 3600
+RATE_LIMIT_BURST = 80
+RATE_LIMIT_LOW_WATER = 10
+DELETE_ATTEMPTS = 3
+RETRYABLE_STATUSES = (408, 500, 502, 503, 504)
+
+LIST_REPOSITORIES_QUERY = """
+query($login: String!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER) {
+      nodes { name }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# ANSI color codes used by print_color
+COLORS = {
+    "red": "\033[0;31m",
+    "green": "\033[0;32m",
+    "yellow": "\033[1;33m",
+    "blue": "\033[0;34m",
+    "cyan": "\033[0;36m",
+}
+RESET_COLOR = "\033[0m"
+
+# Interactive selection: numbers or ranges separated by spaces or commas
+SELECTION_SEPARATOR = re.compile(r"[\s,]+")
+SELECTION_PATTERN = re.compile(r"(\d+)(?:-(\d+))?")
+
+
+def cache_path(key: str) -> Path:
+    """Location of a cache entry"""
+    return CACHE_DIR / f"{quote(key, safe='')}.json"
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how often deletions are issued"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.interval = 0.0
+        self.interval_until = 0.0
+        self.next_grant = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self, stop: Optional[threading.Event] = None) -> bool:
+        """Block until a token is available and consume it; False if stop is set first"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+                if now < self.interval_until:
+                    wait = max(wait, self.next_grant - now)
+                if wait <= 0:
+                    self.tokens -= 1
+                    self.next_grant = now + self.interval
+                    return True
+            if stop is None:
+                time.sleep(wait)
+            elif stop.wait(wait):
+                return False
+
+    def slow_down(self, interval: float, duration: float):
+        """Space grants at least interval seconds apart for the next duration seconds"""
+        with self.lock:
+            self.interval = interval
+            self.interval_until = time.monotonic() + duration
+
+
+class ApiResponse:
+    """Status, headers and body of a GitHub API response"""
+
+    def __init__(self, status: int, headers, body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        """Decode the response body as JSON"""
+        return json.loads(self.body) if self.body else None
+
+    def message(self) -> str:
+        """Error message reported by the API, if any"""
+        try:
+            return (self.json() or {}).get("message", "")
+        except (ValueError, AttributeError):
+            return ""
+
+
+class ResponseLost(ConnectionError):
+    """The request was sent but no complete response arrived, so it may have taken effect"""
+
+
+class GitHubSession:
+    """Keep-alive HTTPS session for the GitHub REST API, one connection per thread"""
+
+    def __init__(self, token: str):
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "repo-nuke",
+        }
+        self.local = threading.local()
+
+    def _connection(self):
+        import http.client  # deferred: pulls in ssl and email, slow to import
+        
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(API_HOST, timeout=30)
+            self.local.conn = conn
+        return conn
+
+    def request(self, method: str, path: str, payload=None) -> ApiResponse:
+        """Send a request, reconnecting once if the kept-alive connection was dropped
+        
+        Transport failures are raised as OSError; ResponseLost when the
+        request had already been sent.
+        """
+        import http.client
+        
+        headers = dict(self.headers)
+        body = None
+        if payload is not None:
+            body = json.dumps(payload)
+            headers["Content-Type"] = "application/json"
+        
+        for attempt in range(2):
+            conn = self._connection()
+            sent = False
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                sent = True
+                resp = conn.getresponse()
+                return ApiResponse(resp.status, resp.headers, resp.read())
+            except Exception as e:
+                # Any failure can leave the connection mid-request; never reuse it
+                conn.close()
+                self.local.conn = None
+                if isinstance(e, (ConnectionResetError, BrokenPipeError)) and not attempt:
+                    continue  # stale keep-alive connection (includes RemoteDisconnected)
+                if sent and isinstance(e, (OSError, http.client.HTTPException)):
+                    raise ResponseLost(f"{type(e).__name__}: {e}") from e
+                if isinstance(e, http.client.HTTPException):
+                    raise ConnectionError(f"{type(e).__name__}: {e}") from e
+                raise
+
+    def get(self, path: str) -> ApiResponse:
+        return self.request("GET", path)
+
+    def delete(self, path: str) -> ApiResponse:
+        return self.request("DELETE", path)
+
+    def post(self, path: str, payload) -> ApiResponse:
+        return self.request("POST", path, payload)
+
 
 # Global state
 class BatchDeleter:
+    __slots__ = (
+        "username", "login", "repositories", "successful_deletions", "failed_deletions",
+        "completed", "total",
+        "verbose", "dry_run", "use_color", "use_cache", "strict_validate", "workers",
+        "session", "lock", "log_lock", "log_file", "rate_limiter", "stop",
+    )
+    
     def __init__(self):
         self.username = ""
+        self.login = ""
         self.repositories = []
         self.successful_deletions = 0
         self.failed_deletions = 0
+        self.completed = 0
+        self.total = 0
         self.verbose = False
         self.dry_run = False
+        self.use_color = sys.stdout.isatty()
+        self.use_cache = True
+        self.strict_validate = False
+        self.workers = DEFAULT_WORKERS
+        self.session: Optional[GitHubSession] = None
+        self.lock = threading.Lock()
+        self.log_lock = threading.Lock()
+        # Line-buffered: each entry reaches the OS as soon as it is written, so the
+        # record of deleted repositories survives the process being killed
+        self.log_file = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+        atexit.register(self.log_file.close)
+        self.rate_limiter: Optional[RateLimiter] = None
+        self.stop = threading.Event()
     
     def log(self, message: str):
         """Log message to file with timestamp"""
+        from datetime import datetime
+        
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(f"{timestamp} - {message}\n")
-    
-    def print_color(self, message: str, color: str = ""):
-        """Print colored output"""
-        colors = {
-            "red": "\033[0;31m",
-            "green": "\033[0;32m",
-            "yellow": "\033[1;33m",
-            "blue": "\033[0;34m",
-            "cyan": "\033[0;36m",
-            "reset": "\033[0m"
-        }
+        with self.log_lock:
+            self.log_file.write(f"{timestamp} - {message}\n")
+    
+    def cached_json(self, key: str, ttl: int, fetch):
+        """Return fetch() result, reusing a copy cached on disk for ttl seconds"""
+        path = cache_path(key)
+        if self.use_cache:
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+                if time.time() - entry["ts"] < ttl:
+                    return entry["data"]
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
         
-        if color and color in colors:
-            print(f"{colors[color]}{message}{colors['reset']}")
-        else:
-            print(message)
+        data = fetch()
+        # Failed lookups return None and are not cached
+        if self.use_cache and data is not None:
+            self.write_cache(key, data)
+        return data
     
-    def check_gh_cli(self):
-        """Check if GitHub CLI is installed"""
+    def write_cache(self, key: str, data, timestamp: Optional[float] = None):
+        """Store data in the on-disk cache"""
+        path = cache_path(key)
+        entry = {"ts": time.time() if timestamp is None else timestamp, "data": data}
         try:
-            subprocess.run(["gh", "--version"], 
-                         capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            self.print_color("❌ GitHub CLI (gh) is not installed!", "red")
-            self.print_color("Please install it first:", "yellow")
-            self.print_color("  Windows: winget install --id GitHub.cli", "blue")
-            self.print_color("  macOS: brew install gh", "blue")
-            self.print_color("  Linux: sudo apt install gh", "blue")
-            sys.exit(1)
+            CACHE_DIR.mkdir(exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+    
+    def forget_repositories(self, deleted: List[str]):
+        """Drop deleted repositories from the cached repository list"""
+        key = f"repos-{self.username}"
+        try:
+            entry = json.loads(cache_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        gone = set(deleted)
+        try:
+            repos = [repo for repo in entry["data"] if repo not in gone]
+            self.write_cache(key, repos, entry["ts"])
+        except (KeyError, TypeError):
+            pass
+    
+    def print_color(self, message: str, color: str = "", progress: bool = False):
+        """Print colored output (plain text when stdout is not a terminal)
+        
+        With progress=True the line reports a finished repository and is
+        prefixed with the completed count, e.g. [3/10].
+        """
+        prefix = COLORS.get(color, "") if self.use_color else ""
+        with self.lock:
+            if progress:
+                self.completed += 1
+                message = f"[{self.completed}/{self.total}] {message}"
+            line = f"{prefix}{message}{RESET_COLOR}\n" if prefix else f"{message}\n"
+            sys.stdout.write(line)
     
     def check_auth(self):
         """Check authentication and permissions"""
         self.print_color("🔍 Checking GitHub authentication...", "blue")
         
-        try:
-            subprocess.run(["gh", "auth", "status"], 
-                         capture_output=True, check=True)
-        except subprocess.CalledProcessError:
-            self.print_color("❌ Not authenticated with GitHub!", "red")
-            self.print_color("Please run: gh auth login", "yellow")
-            sys.exit(1)
+        user = self.connect()
         
-        # Check if we have delete_repo scope
-        try:
-            subprocess.run(["gh", "api", "user", "--silent"], 
-                         capture_output=True, check=True)
-        except subprocess.CalledProcessError:
+        # Classic tokens list their scopes; fine-grained tokens don't send the header
+        scopes = user.headers.get("X-OAuth-Scopes")
+        if scopes is not None and "delete_repo" not in [scope.strip() for scope in scopes.split(",")]:
             self.print_color("⚠️  Checking delete permissions...", "yellow")
             try:
                 subprocess.run(["gh", "auth", "refresh", "-h", "github.com", 
@@ -91,30 +312,82 @@ class BatchDeleter:
                 self.print_color("❌ Failed to get delete permissions!", "red")
                 self.print_color("Please run: gh auth refresh -h github.com -s delete_repo", "yellow")
                 sys.exit(1)
+            user = self.connect()
         
+        self.login = (user.json() or {}).get("login", "")
         self.print_color("✅ Authentication verified", "green")
     
+    def connect(self) -> ApiResponse:
+        """Open an API session with the GitHub CLI token and fetch the current user"""
+        try:
+            result = subprocess.run(["gh", "auth", "token"], 
+                                  capture_output=True, text=True, check=True)
+        except FileNotFoundError:
+            self.print_color("❌ GitHub CLI (gh) is not installed!", "red")
+            self.print_color("Please install it first:", "yellow")
+            self.print_color("  Windows: winget install --id GitHub.cli", "blue")
+            self.print_color("  macOS: brew install gh", "blue")
+            self.print_color("  Linux: sudo apt install gh", "blue")
+            sys.exit(1)
+        except subprocess.CalledProcessError:
+            self.print_color("❌ Not authenticated with GitHub!", "red")
+            self.print_color("Please run: gh auth login", "yellow")
+            sys.exit(1)
+        
+        self.session = GitHubSession(result.stdout.strip())
+        try:
+            user = self.session.get("/user")
+        except OSError as e:
+            self.print_color(f"❌ Could not reach GitHub: {e}", "red")
+            sys.exit(1)
+        
+        if user.status in (401, 403):
+            self.print_color("❌ Not authenticated with GitHub!", "red")
+            self.print_color("Please run: gh auth login", "yellow")
+            sys.exit(1)
+        if user.status != 200:
+            self.print_color(f"❌ Could not verify authentication: {user.message() or f'HTTP {user.status}'}", "red")
+            sys.exit(1)
+        return user
+    
+    def repo_path(self, repo: str) -> str:
+        """REST API path of a repository owned by the current user"""
+        return f"/repos/{quote(self.username, safe='')}/{quote(repo, safe='')}"
+    
     def get_username(self):
-        """Get current GitHub username"""
+        """Use the authenticated user's login unless a username was given"""
         if not self.username:
-            result = subprocess.run(["gh", "api", "user", "--jq", ".login"], capture_output=True, text=True)
-            if result.returncode == 0:
-                self.username = result.stdout.strip()
-            else:
-                self.print_color("❌ Could not determine GitHub username", "red")
+            self.username = self.login
+        if not self.username:
+            self.print_color("❌ Could not determine GitHub username", "red")
         self.print_color(f"👤 Using GitHub username: {self.username}", "cyan")
     
     def list_repositories(self) -> List[str]:
         """List user repositories"""
         self.print_color("📋 Fetching your repositories...", "blue")
-        try:
-            result = subprocess.run([
-                "gh", "repo", "list", self.username, 
-                "--limit", "100", "--json", "name", "--jq", ".[].name"
-            ], capture_output=True, text=True, check=True)
-            return [repo.strip() for repo in result.stdout.split('\n') if repo.strip()]
-        except subprocess.CalledProcessError:
-            return []
+        
+        def fetch():
+            repos = []
+            cursor = None
+            while True:
+                payload = {
+                    "query": LIST_REPOSITORIES_QUERY,
+                    "variables": {"login": self.username, "cursor": cursor},
+                }
+                try:
+                    resp = self.session.post("/graphql", payload)
+                    owner = ((resp.json() or {}).get("data") or {}).get("repositoryOwner")
+                except (OSError, ValueError):
+                    return None
+                if resp.status != 200 or not owner:
+                    return None
+                page = owner["repositories"]
+                repos.extend(node["name"] for node in page["nodes"])
+                if not page["pageInfo"]["hasNextPage"]:
+                    return repos
+                cursor = page["pageInfo"]["endCursor"]
+        
+        return self.cached_json(f"repos-{self.username}", CACHE_TTL, fetch) or []
     
     def interactive_selection(self):
         """Interactive repository selection"""
@@ -132,7 +405,7 @@ class BatchDeleter:
             print(f"{i:3d}) {repo}")
         
         print()
-        self.print_color("Enter repository numbers to delete (space-separated, e.g., 1 3 5):", "cyan")
+        self.print_color("Enter repository numbers or ranges to delete (e.g., 1 3 5-8):", "cyan")
         self.print_color("Or enter 'all' to select all repositories", "yellow")
         
         try:
@@ -145,16 +418,19 @@ class BatchDeleter:
             self.repositories = repos
         else:
             selected = []
-            for num_str in selection.split():
-                try:
-                    num = int(num_str)
-                    if 1 <= num <= len(repos):
-                        selected.append(repos[num - 1])
-                    else:
-                        self.print_color(f"⚠️  Skipping invalid selection: {num_str}", "yellow")
-                except ValueError:
-                    self.print_color(f"⚠️  Skipping invalid selection: {num_str}", "yellow")
-            self.repositories = selected
+            for token in SELECTION_SEPARATOR.split(selection):
+                if not token:
+                    continue
+                match = SELECTION_PATTERN.fullmatch(token)
+                if match:
+                    low = int(match[1])
+                    high = int(match[2] or match[1])
+                if not match or not 1 <= low <= high <= len(repos):
+                    self.print_color(f"⚠️  Skipping invalid selection: {token}", "yellow")
+                    continue
+                selected.extend(repos[low - 1:high])
+            # Drop duplicates from overlapping selections, keeping order
+            self.repositories = list(dict.fromkeys(selected))
         
         if not self.repositories:
             self.print_color("No repositories selected. Exiting.", "yellow")
@@ -162,34 +438,36 @@ class BatchDeleter:
     
     def load_from_file(self, file_path: str):
         """Load repositories from file"""
-        if not os.path.exists(file_path):
+        try:
+            text = Path(file_path).read_text(encoding='utf-8')
+        except FileNotFoundError:
             self.print_color(f"❌ File not found: {file_path}", "red")
             sys.exit(1)
-        
-        repos = []
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if line and not line.startswith('#'):
-                        repos.append(line)
-        except Exception as e:
+        except (OSError, UnicodeDecodeError) as e:
             self.print_color(f"❌ Error reading file: {e}", "red")
             sys.exit(1)
         
+        # Skip empty lines and comments
+        repos = [line for line in map(str.strip, text.splitlines()) if line and line[0] != '#']
+        
         self.repositories = repos
         self.print_color(f"📂 Loaded {len(repos)} repositories from {file_path}", "green")
     
     def load_config(self, config_path: str):
         """Load configuration from JSON file"""
-        if not os.path.exists(config_path):
-            self.print_color(f"❌ Configuration file not found: {config_path}", "red")
-            sys.exit(1)
+        # orjson parses large configuration files much faster when it is installed
+        try:
+            from orjson import loads as json_loads
+        except ImportError:
+            json_loads = json.loads
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            with open(config_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > MAX_CONFIG_SIZE:
+                    self.print_color(f"❌ Configuration file is too large ({size} bytes, limit {MAX_CONFIG_SIZE}): {config_path}", "red")
+                    sys.exit(1)
+                config = json_loads(f.read())
             
             if 'username' in config and config['username']:
                 self.username = config['username']
@@ -199,6 +477,9 @@ class BatchDeleter:
             
             self.print_color(f"⚙️  Loaded configuration from {config_path}", "green")
         
+        except FileNotFoundError:
+            self.print_color(f"❌ Configuration file not found: {config_path}", "red")
+            sys.exit(1)
         except json.JSONDecodeError as e:
             self.print_color(f"❌ Failed to parse configuration file: {e}", "red")
             sys.exit(1)
@@ -206,34 +487,140 @@ class BatchDeleter:
             self.print_color(f"❌ Error loading configuration: {e}", "red")
             sys.exit(1)
     
-    def validate_repository(self, repo: str) -> bool:
-        """Validate repository exists"""
+    def validate_repositories(self, repos: List[str]) -> List[str]:
+        """Return the repositories that exist, checked with batched GraphQL queries"""
+        existing = []
+        owner = json.dumps(self.username)
+        for start in range(0, len(repos), GRAPHQL_BATCH_SIZE):
+            chunk = repos[start:start + GRAPHQL_BATCH_SIZE]
+            fields = " ".join(
+                f"r{i}: repository(owner: {owner}, name: {json.dumps(repo)}) {{ name }}"
+                for i, repo in enumerate(chunk)
+            )
+            try:
+                resp = self.session.post("/graphql", {"query": f"query {{ {fields} }}"})
+            except OSError as e:
+                self.print_color(f"❌ Failed to validate repositories: {e}", "red")
+                sys.exit(1)
+            data = (resp.json() or {}).get("data") if resp.status == 200 else None
+            if data is None:
+                reason = resp.message() or f"HTTP {resp.status}"
+                self.print_color(f"❌ Failed to validate repositories: {reason}", "red")
+                sys.exit(1)
+            # Missing or inaccessible repositories resolve to null
+            existing.extend(repo for i, repo in enumerate(chunk) if data.get(f"r{i}"))
+        return existing
+    
+    def rate_limit_wait(self, resp: ApiResponse) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, None if not rate limited"""
+        if resp.status not in (403, 429):
+            return None
         try:
-            subprocess.run(["gh", "repo", "view", f"{self.username}/{repo}"], 
-                         capture_output=True, check=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            retry_after = resp.headers.get("Retry-After")
+            if retry_after:
+                return float(retry_after)
+            if resp.headers.get("X-RateLimit-Remaining") == "0":
+                reset = float(resp.headers.get("X-RateLimit-Reset", 0))
+                return max(0.0, reset - time.time())
+        except ValueError:
+            return None
+        # GitHub asks clients to wait at least a minute after a secondary rate limit
+        if "secondary rate limit" in resp.message().lower():
+            return 60.0
+        return None
+    
+    def throttle(self, resp: ApiResponse):
+        """Spread the remaining requests over the rate limit window when the quota runs low
+        
+        The spacing is applied by the shared rate limiter, so all workers slow
+        down together before their next request.
+        """
+        try:
+            remaining = int(resp.headers.get("X-RateLimit-Remaining", RATE_LIMIT_LOW_WATER))
+            reset = float(resp.headers.get("X-RateLimit-Reset", 0))
+        except ValueError:
+            return
+        if 0 < remaining < RATE_LIMIT_LOW_WATER:
+            window = max(0.0, reset - time.time())
+            self.rate_limiter.slow_down(window / remaining, window)
     
-    def delete_repository(self, repo: str) -> bool:
-        """Delete single repository"""
+    def delete_repository(self, repo: str) -> Optional[bool]:
+        """Delete single repository, returning None if the run was interrupted first"""
+        if self.stop.is_set():
+            return None
+        
         if self.dry_run:
-            self.print_color(f"[DRY RUN] Would delete: {self.username}/{repo}", "blue")
+            self.print_color(f"[DRY RUN] Would delete: {self.username}/{repo}", "blue", progress=True)
             return True
         
         if self.verbose:
             self.print_color(f"🗑️  Deleting repository: {self.username}/{repo}", "blue")
         
-        try:
-            subprocess.run(["gh", "repo", "delete", f"{self.username}/{repo}", "--yes"], 
-                         capture_output=True, check=True)
-            self.print_color(f"✅ Successfully deleted: {self.username}/{repo}", "green")
+        # Retry transient failures; rate-limited responses wait as instructed,
+        # everything else backs off exponentially (1s, 2s, ...)
+        # An attempt answered with 408/5xx, or whose response was lost, may
+        # still have deleted the repository
+        outcome_unknown = False
+        for attempt in range(1, DELETE_ATTEMPTS + 1):
+            if not self.rate_limiter.acquire(self.stop) or self.stop.is_set():
+                if attempt == 1:
+                    return None
+                break
+            resp, error, wait = None, None, None
+            try:
+                resp = self.session.delete(self.repo_path(repo))
+            except ResponseLost as e:
+                error = e
+                outcome_unknown = True
+            except OSError as e:
+                # Never reached GitHub (refused, DNS, TLS), so nothing was deleted
+                error = e
+            
+            if resp is not None:
+                self.throttle(resp)
+                wait = self.rate_limit_wait(resp)
+                if wait is None and resp.status not in RETRYABLE_STATUSES:
+                    break
+                if resp.status in RETRYABLE_STATUSES:
+                    outcome_unknown = True
+            if attempt == DELETE_ATTEMPTS:
+                break
+            
+            if wait is None:
+                wait = 2 ** (attempt - 1)
+            if error is not None:
+                reason = str(error) or type(error).__name__
+            else:
+                reason = resp.message() or f"HTTP {resp.status}"
+            self.log(f"RETRY: Attempt {attempt} to delete {self.username}/{repo} failed ({reason}), retrying in {wait:g}s")
+            if self.stop.wait(wait):
+                break
+        
+        if error is not None:
+            reason = str(error) or type(error).__name__
+            self.print_color(f"❌ Failed to delete: {self.username}/{repo} ({reason})", "red", progress=True)
+            self.log(f"FAILED: Could not delete repository {self.username}/{repo}: {reason}")
+            return False
+        
+        if resp.status == 204:
+            self.print_color(f"✅ Successfully deleted: {self.username}/{repo}", "green", progress=True)
             self.log(f"SUCCESS: Deleted repository {self.username}/{repo}")
             return True
-        except subprocess.CalledProcessError:
-            self.print_color(f"❌ Failed to delete: {self.username}/{repo}", "red")
-            self.log(f"FAILED: Could not delete repository {self.username}/{repo}")
+        
+        if resp.status == 404 and outcome_unknown:
+            self.print_color(f"✅ Probably deleted: {self.username}/{repo} (gone after an earlier attempt failed)", "green", progress=True)
+            self.log(f"SUCCESS: Repository {self.username}/{repo} not found after an earlier attempt failed, probably deleted")
+            return True
+        
+        if resp.status == 404:
+            self.print_color(f"⚠️  Repository not found or inaccessible: {self.username}/{repo}", "yellow", progress=True)
+            self.log(f"FAILED: Repository not found {self.username}/{repo}")
             return False
+        
+        reason = resp.message() or f"HTTP {resp.status}"
+        self.print_color(f"❌ Failed to delete: {self.username}/{repo} ({reason})", "red", progress=True)
+        self.log(f"FAILED: Could not delete repository {self.username}/{repo}: {reason}")
+        return False
     
     def batch_delete(self, auto_confirm: bool = False):
         """Main deletion process"""
@@ -245,14 +632,16 @@ class BatchDeleter:
         self.print_color(f"Total repositories to delete: {total}", "blue")
         print()
         
-        # Validate repositories first
-        valid_repos = []
-        for repo in self.repositories:
-            if self.validate_repository(repo):
-                valid_repos.append(repo)
-            else:
-                self.print_color(f"⚠️  Repository not found or inaccessible: {self.username}/{repo}", "yellow")
-                self.failed_deletions += 1
+        # Missing repositories are reported by the DELETE call itself; validate
+        # up front only when asked to, or when nothing will be deleted
+        valid_repos = list(self.repositories)
+        if self.strict_validate or self.dry_run:
+            valid_repos = self.validate_repositories(self.repositories)
+            found = set(valid_repos)
+            for repo in self.repositories:
+                if repo not in found:
+                    self.print_color(f"⚠️  Repository not found or inaccessible: {self.username}/{repo}", "yellow")
+                    self.failed_deletions += 1
         
         if not valid_repos:
             self.print_color("❌ No valid repositories found to delete", "red")
@@ -281,18 +670,55 @@ class BatchDeleter:
         
         print()
         self.print_color("🔄 Processing deletions...", "green")
+        self.completed = 0
+        self.total = len(valid_repos)
         
-        # Delete repositories
-        for i, repo in enumerate(valid_repos, 1):
-            print(f"[{i}/{len(valid_repos)}] ", end="", flush=True)
-            
-            if self.delete_repository(repo):
-                self.successful_deletions += 1
-            else:
-                self.failed_deletions += 1
-            
-            # Small delay to avoid rate limiting
-            time.sleep(0.5)
+        # Delete repositories in parallel; the rate limiter paces the requests.
+        # Its burst is fixed so a large --workers value can't exceed the budget
+        self.rate_limiter = RateLimiter(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        deleted_repos = []
+        cancelled = 0
+        
+        def record(future):
+            nonlocal cancelled
+            try:
+                deleted = future.result()
+            except Exception as e:
+                self.print_color(f"❌ Failed to delete: {self.username}/{futures[future]} ({e})", "red", progress=True)
+                deleted = False
+            with self.lock:
+                if deleted is None:
+                    cancelled += 1
+                elif deleted:
+                    self.successful_deletions += 1
+                    deleted_repos.append(futures[future])
+                else:
+                    self.failed_deletions += 1
+        
+        self.stop.clear()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self.delete_repository, repo): repo for repo in valid_repos}
+            pending = set(futures)
+            try:
+                for future in as_completed(futures):
+                    pending.discard(future)
+                    record(future)
+            except KeyboardInterrupt:
+                # Stop issuing deletions; let requests already sent finish
+                self.stop.set()
+                print()
+                self.print_color("⏹️  Interrupted! Waiting for deletions in progress...", "yellow")
+                pool.shutdown(wait=True, cancel_futures=True)
+                for future in pending:
+                    if future.cancelled():
+                        cancelled += 1
+                    else:
+                        record(future)
+        
+        if not self.dry_run and deleted_repos:
+            self.forget_repositories(deleted_repos)
         
         # Summary
         print()
@@ -300,15 +726,20 @@ class BatchDeleter:
         self.print_color(f"  ✅ Successfully processed: {self.successful_deletions} repositories", "green")
         self.print_color(f"  ❌ Failed to process: {self.failed_deletions} repositories", "red")
         self.print_color(f"  📋 Total processed: {self.successful_deletions + self.failed_deletions} repositories", "blue")
+        if cancelled:
+            self.print_color(f"  ⏹️  Cancelled: {cancelled} repositories", "yellow")
         
         if not self.dry_run:
-            self.log(f"SUMMARY: Processed {self.successful_deletions + self.failed_deletions} repositories, {self.successful_deletions} successful, {self.failed_deletions} failed")
+            self.log(f"SUMMARY: Processed {self.successful_deletions + self.failed_deletions} repositories, {self.successful_deletions} successful, {self.failed_deletions} failed, {cancelled} cancelled")
         
         if self.failed_deletions > 0:
             print()
             self.print_color(f"⚠️  Some operations failed. Check the log file: {LOG_FILE}", "yellow")
         
-        self.print_color("🎉 Batch deletion process completed!", "green")
+        if cancelled:
+            self.print_color("⏹️  Batch deletion process interrupted.", "yellow")
+        else:
+            self.print_color("🎉 Batch deletion process completed!", "green")
 
 
 def main():
@@ -339,13 +770,24 @@ Examples:
                        help="Show what would be deleted without deleting")
     parser.add_argument("--interactive", action="store_true", 
                        help="Interactive repository selection mode")
+    parser.add_argument("--strict-validate", action="store_true", 
+                       help="Check that repositories exist before asking for confirmation")
+    parser.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS, 
+                       help=f"Number of deletions to run in parallel (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--no-cache", action="store_true", 
+                       help="Always fetch the repository list from GitHub")
     
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
     
     # Create deleter instance
     deleter = BatchDeleter()
     deleter.verbose = args.verbose
     deleter.dry_run = args.dry_run
+    deleter.use_cache = not args.no_cache
+    deleter.strict_validate = args.strict_validate
+    deleter.workers = args.workers
     
     if args.username:
         deleter.username = args.username
@@ -356,17 +798,22 @@ Examples:
     # Initialize log
     deleter.log("Starting GitHub Batch Delete session")
     
-    # Check prerequisites
-    deleter.check_gh_cli()
-    deleter.check_auth()
-    deleter.get_username()
+    # Check prerequisites over the network while input files are read
+    from concurrent.futures import ThreadPoolExecutor
     
-    # Process input parameters
-    if args.config:
-        deleter.load_config(args.config)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        auth = pool.submit(deleter.check_auth)
+        
+        # Process input parameters
+        if args.config:
+            deleter.load_config(args.config)
+        
+        if args.file:
+            deleter.load_from_file(args.file)
+        
+        auth.result()
     
-    if args.file:
-        deleter.load_from_file(args.file)
+    deleter.get_username()
     
     # Add command line repositories
     if args.repositories: